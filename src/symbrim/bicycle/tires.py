@@ -87,7 +87,7 @@ class TireBase(ConnectionBase):
         name = "The upward radial axis of the wheel"
         if not isinstance(axis, Vector):
             raise TypeError(f"{name} should be a vector, but received a {type(axis)}")
-        if not check_zero(axis.magnitude() - 1):
+        if not check_zero(axis.dot(axis) - 1):
             raise ValueError(f"{name} should be normalized.")
         if not check_zero(axis.dot(self.wheel.rotation_axis)):
             raise ValueError(f"{name} should be perpendicular to the rotation axis.")
@@ -110,7 +110,7 @@ class TireBase(ConnectionBase):
         name = "The longitudinal axis of the wheel"
         if not isinstance(axis, Vector):
             raise TypeError(f"{name} should be a vector, but received a {type(axis)}")
-        if not check_zero(axis.magnitude() - 1):
+        if not check_zero(axis.dot(axis) - 1):
             raise ValueError(f"{name} should be normalized.")
         if not check_zero(axis.dot(self.wheel.rotation_axis)):
             raise ValueError(f"{name} should be perpendicular to the rotation axis.")
@@ -133,7 +133,7 @@ class TireBase(ConnectionBase):
         name = "The lateral axis of the wheel"
         if not isinstance(axis, Vector):
             raise TypeError(f"{name} should be a vector, but received a {type(axis)}")
-        if not check_zero(axis.magnitude() - 1):
+        if not check_zero(axis.dot(axis) - 1):
             raise ValueError(f"{name} should be normalized.")
         if not check_zero(axis.dot(self.longitudinal_axis)):
             raise ValueError(
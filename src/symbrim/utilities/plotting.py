@@ -18,6 +18,8 @@ from typing_extensions import Self
 from symbrim.core import ConnectionBase, LoadGroupBase, ModelBase
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from mpl_toolkits.mplot3d.axes3d import Axes3D
     from sympy import Expr
     from sympy.physics.mechanics import Point, ReferenceFrame
@@ -100,6 +102,51 @@ class Plotter(Scene3D):
         self.add_plot_object(obj)
         return obj
 
+    def add_models(
+        self, models: Iterable[ModelBase], **kwargs: dict[str, object]
+    ) -> list[PlotModel]:
+        """Add multiple models to the plotter at once.
+
+        Parameters
+        ----------
+        models : iterable of ModelBase
+            Models to add.
+        **kwargs
+            Keyword arguments are passed to each
+            :class:`symbrim.utilities.plotting.PlotModel`.
+        """
+        return [self.add_model(model, **kwargs) for model in models]
+
+    def add_connections(
+        self, connections: Iterable[ConnectionBase], **kwargs: dict[str, object]
+    ) -> list[PlotConnection]:
+        """Add multiple connections to the plotter at once.
+
+        Parameters
+        ----------
+        connections : iterable of ConnectionBase
+            Connections to add.
+        **kwargs
+            Keyword arguments are passed to each
+            :class:`symbrim.utilities.plotting.PlotConnection`.
+        """
+        return [self.add_connection(connection, **kwargs) for connection in connections]
+
+    def add_load_groups(
+        self, load_groups: Iterable[LoadGroupBase], **kwargs: dict[str, object]
+    ) -> list[PlotLoadGroup]:
+        """Add multiple load groups to the plotter at once.
+
+        Parameters
+        ----------
+        load_groups : iterable of LoadGroupBase
+            Load groups to add.
+        **kwargs
+            Keyword arguments are passed to each
+            :class:`symbrim.utilities.plotting.PlotLoadGroup`.
+        """
+        return [self.add_load_group(load_group, **kwargs) for load_group in load_groups]
+
 
 class PlotBrimMixin:
     """Mixin class for plotting SymBRiM objects."""
@@ -131,9 +178,9 @@ class PlotBrimMixin:
             annot_point = self.zero_point
         else:
             annot_point = self.sympy_object.system.fixed_point
-        return tuple(
-            annot_point.pos_from(self.zero_point).to_matrix(self.inertial_frame)[:]
-        )
+        rel = annot_point.pos_from(self.zero_point)
+        return (rel.dot(self.inertial_frame.x), rel.dot(self.inertial_frame.y),
+                rel.dot(self.inertial_frame.z))
 
     @property
     def annot_coords(self) -> np.ndarray[np.float64]:
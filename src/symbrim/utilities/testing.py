@@ -5,6 +5,7 @@ from __future__ import annotations
 import os
 import warnings
 from contextlib import contextmanager
+from functools import cache
 from typing import TYPE_CHECKING
 
 from sympy.physics.mechanics import System
@@ -29,13 +30,22 @@ def _test_descriptions(instance: ModelBase | ConnectionBase | LoadGroupBase) ->
     else:
         instance.define_connections()
         instance.define_objects()
-    for sym in (*instance.symbols.values(), *instance.q, *instance.u, *instance.u_aux):
-        if sym not in instance.descriptions:
-            raise ValueError(f"Description missing for {sym}")
+    descriptions = instance.descriptions
+    missing = [sym for sym in (*instance.symbols.values(), *instance.q, *instance.u,
+                               *instance.u_aux) if sym not in descriptions]
+    if missing:
+        raise ValueError(f"Description missing for {', '.join(map(str, missing))}")
 
 
+@cache
 def create_model_of_connection(connection_cls: type[ConnectionBase]) -> type[ModelBase]:
-    """Create a model which uses the connection."""
+    """Create a model which uses the connection.
+
+    Explanation
+    -----------
+    The created class is cached per connection class. This is safe, because the
+    class itself holds no state; all state is stored on its instances.
+    """
     required_connections = (ConnectionRequirement("conn", connection_cls),)
     required_models = connection_cls.required_models
 
@@ -1,25 +1,171 @@
 """Utilities for SymBRiM."""
 from __future__ import annotations
 
+import hashlib
+import importlib
+import inspect
+import os
+import platform
+import tempfile
+from functools import cache, partial
+from pathlib import Path
+from typing import TYPE_CHECKING
+
 import numpy as np
-from sympy import Basic, Derivative, Dummy, Expr, lambdify
+import sympy
+from sympy import Basic, Derivative, Dummy, Expr, default_sort_key, lambdify, srepr
 from sympy.core.random import random
 from sympy.physics.mechanics import find_dynamicsymbols, msubs
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from types import CodeType
+
 __all__ = ["random_eval", "check_zero"]
 
+_LAMBDIFY_CACHE_DIR = (Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") /
+                       "symbrim" / "lambdify")
+
+
+@cache
+def _lambdify_namespace() -> dict[str, object]:
+    """Namespace in which the default lambdified functions are executed."""
+    return lambdify((), 0).__globals__
+
+
+def _expr_digest(obj: object) -> str:
+    """Compute a digest of an expression, which is stable across sessions.
+
+    Explanation
+    -----------
+    Unlike :func:`sympy.srepr`, which writes out every repeated subexpression in full,
+    each unique subexpression is only hashed once. This keeps the digest cheap for the
+    large expressions of the equations of motion.
+    """
+    memo: dict[Basic, bytes] = {}
+    dummies: dict[Dummy, int] = {}
+
+    def digest(node: object) -> bytes:
+        if isinstance(node, Basic):
+            if node in memo:
+                return memo[node]
+            if isinstance(node, Dummy):
+                # The index of a dummy differs between sessions, so dummies are
+                # identified by the order in which they are encountered.
+                data = (f"Dummy{dummies.setdefault(node, len(dummies))}"
+                        f"{sorted(node.assumptions0.items())}").encode()
+            elif node.args and not node.is_Atom:
+                data = type(node).__name__.encode() + b"".join(map(digest, node.args))
+            else:
+                data = srepr(node).encode()
+            memo[node] = hashlib.blake2b(data, digest_size=16).digest()
+            return memo[node]
+        if isinstance(node, (tuple, list)) or hasattr(node, "shape"):
+            items = b"".join(digest(item) for item in node)
+            return hashlib.blake2b(
+                f"{type(node).__name__}{getattr(node, 'shape', len(node))}".encode() +
+                items, digest_size=16).digest()
+        if isinstance(node, partial):
+            return digest((node.func, node.args, sorted(node.keywords.items())))
+        if callable(node):
+            # The repr of a function contains its memory address.
+            return f"{node.__module__}.{node.__qualname__}".encode()
+        return repr(node).encode()
+
+    return hashlib.blake2b(digest(obj)).hexdigest()
+
+
+def _global_names(code: CodeType) -> set[str]:
+    """Get the names used by a code object, including those of nested code objects."""
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if inspect.iscode(const):
+            names |= _global_names(const)
+    return names
+
+
+def _import_lines(f: Callable) -> list[str] | None:
+    """Get the imports of the names lambdify added to the namespace of a function.
+
+    Explanation
+    -----------
+    Depending on the expression, :func:`sympy.lambdify` adds names to the namespace of
+    the generated function, e.g. ``reduce`` for ``Max``. These are not part of the
+    generated source code. If one of these names cannot be imported, None is returned.
+    """
+    base, namespace = _lambdify_namespace(), f.__globals__
+    lines = []
+    for name in sorted(_global_names(f.__code__)):
+        if name not in namespace or base.get(name, None) is namespace[name]:
+            continue
+        value = namespace[name]
+        if inspect.ismodule(value):
+            lines.append(f"import {value.__name__} as {name}")
+            continue
+        module, qualname = (getattr(value, "__module__", None),
+                            getattr(value, "__qualname__", None))
+        if module is None or qualname is None or "." in qualname:
+            return None
+        try:
+            if getattr(importlib.import_module(module), qualname) is not value:
+                return None
+        except (ImportError, AttributeError):
+            return None
+        lines.append(f"from {module} import {qualname} as {name}")
+    return lines
+
+
+def _lambdify(args: Sequence[Basic], expr: Expr, **kwargs: object) -> Callable:
+    """Lambdify an expression, optionally caching the generated source on disk.
+
+    Explanation
+    -----------
+    If the environment variable ``SYMBRIM_LAMBDIFY_CACHE`` is set to ``1``, the source
+    code generated by :func:`sympy.lambdify` is stored in ``symbrim/lambdify`` in the
+    cache directory, ``$XDG_CACHE_HOME`` or ``~/.cache`` by default, such that it can be
+    reused in later sessions. The cache is keyed on a digest of the SymPy and Python
+    versions, arguments, expression and keyword arguments. The order of the arguments
+    should therefore be deterministic. Only functions using the default modules are
+    cached.
+    """
+    if (os.getenv("SYMBRIM_LAMBDIFY_CACHE") != "1" or
+            kwargs.get("modules") is not None or kwargs.get("printer") is not None):
+        return lambdify(args, expr, **kwargs)
+    key = _expr_digest((sympy.__version__, platform.python_version(), tuple(args),
+                        expr, sorted(kwargs.items())))
+    path = _LAMBDIFY_CACHE_DIR / f"{key}.py"
+    if not path.exists():
+        f = lambdify(args, expr, **kwargs)
+        imports = _import_lines(f)
+        if imports is None:
+            return f
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, such that concurrent processes never read
+        # a partially written file.
+        with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False) as file:
+            file.write("".join(f"{line}\n" for line in imports))
+            file.write(inspect.getsource(f))
+        Path(file.name).replace(path)
+        return f
+    namespace = dict(_lambdify_namespace())
+    exec(compile(path.read_text(), str(path), "exec"), namespace)  # noqa: S102
+    return namespace["_lambdifygenerated"]
+
 
 def random_eval(expr: Expr, prec: int = 7, method: str = "lambdify") -> float:
     """Evaluate an expression with random values."""
     if not isinstance(expr, Basic):
         return expr
-    free = tuple(expr.free_symbols.union(find_dynamicsymbols(expr)))
+    free = sorted(expr.free_symbols | find_dynamicsymbols(expr), key=default_sort_key)
     if method == "lambdify":
-        if any(isinstance(f, Derivative) for f in free):
-            dummy_map = {f: Dummy() for f in free if isinstance(f, Derivative)}
-            free = tuple(dummy_map.get(f, f) for f in free)
+        dummy_map = {}
+        for i, f in enumerate(free):
+            if isinstance(f, Derivative):
+                free[i] = dummy_map[f] = Dummy()
+        if dummy_map:
             expr = msubs(expr, dummy_map)
-        return round(lambdify(free, expr, cse=True)(*(random() for _ in free)), prec)
+        return round(_lambdify(free, expr, cse=True)(*(random() for _ in free)), prec)
     if method == "evalf":
         return round(expr.evalf(prec, {s: random() for s in free}), prec)
     raise NotImplementedError(f"Method {method} not implemented.")
@@ -53,14 +199,18 @@ def check_zero(expr: Expr, n_evaluations: int = 10, atol: float = 1e-8) -> bool:
     """
     if not isinstance(expr, Basic):
         return expr == 0
-    free = tuple(expr.free_symbols.union(find_dynamicsymbols(expr)))
-    if any(isinstance(f, Derivative) for f in free):
-        dummy_map = {f: Dummy() for f in free if isinstance(f, Derivative)}
-        free = tuple(dummy_map.get(f, f) for f in free)
+    if expr == 0:
+        # Structurally zero expressions do not need to be lambdified and evaluated.
+        return True
+    free = sorted(expr.free_symbols | find_dynamicsymbols(expr), key=default_sort_key)
+    dummy_map = {}
+    for i, f in enumerate(free):
+        if isinstance(f, Derivative):
+            free[i] = dummy_map[f] = Dummy()
+    if dummy_map:
         expr = msubs(expr, dummy_map)
-    f = lambdify(free, expr, cse=True)
-    # The comparison is to zero, so the relative tolerance is not used.
+    f = _lambdify(free, expr, cse=True)
+    # Evaluate all random samples in a single vectorized call. The comparison is to
+    # zero, so only the absolute tolerance is relevant.
     rng = np.random.default_rng()
-    return np.allclose(
-        np.fromfunction(lambda _: f(*rng.random(len(free))), (n_evaluations,)),
-        np.zeros(n_evaluations), 0, atol)
+    return bool(np.max(np.abs(f(*rng.random((len(free), n_evaluations))))) <= atol)
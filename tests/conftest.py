@@ -8,28 +8,45 @@ def pytest_configure(config):
         "slow: marks tests as slow "
         "(skipped by default, run with '-m slow' or '--run-all')",
     )
+    config.addinivalue_line(
+        "markers",
+        "plot: marks tests as plotting tests "
+        "(skipped by default, run with '--plot' or '--run-all')",
+    )
 
 
 def pytest_addoption(parser):
-    """Add command line options for slow tests."""
+    """Add command line options for slow and plotting tests."""
     parser.addoption(
         "--run-all",
         action="store_true",
         default=False,
-        help="Run all tests including slow tests",
+        help="Run all tests including slow and plotting tests",
+    )
+    parser.addoption(
+        "--plot",
+        action="store_true",
+        default=False,
+        help="Run the plotting tests",
     )
 
 
 def pytest_collection_modifyitems(config, items):
-    """Skip slow tests by default unless --run-all is specified."""
+    """Skip slow and plotting tests by default unless requested."""
     if config.getoption("--run-all"):
-        # --run-all given in cli: do not skip slow tests
+        # --run-all given in cli: do not skip slow or plotting tests
         return
 
+    import pytest
     skip_slow = config.getoption("-m", default="") != "slow"
     if skip_slow:
-        import pytest
         skip_marker = pytest.mark.skip(reason="slow test (use --run-all to run)")
         for item in items:
             if "slow" in item.keywords:
                 item.add_marker(skip_marker)
+
+    if not config.getoption("--plot"):
+        skip_marker = pytest.mark.skip(reason="plotting test (use --plot to run)")
+        for item in items:
+            if "plot" in item.keywords:
+                item.add_marker(skip_marker)
@@ -0,0 +1,28 @@
+"""Lazily imported plotting objects used by the bicycle tests."""
+from __future__ import annotations
+
+from functools import cache
+from types import SimpleNamespace
+
+import pytest
+
+
+@cache
+def _import_plotting() -> SimpleNamespace | None:
+    try:
+        from symmeplot.matplotlib import PlotBody, PlotFrame, PlotLine
+        from symmeplot.matplotlib.artists import Circle3D
+
+        from symbrim.utilities.plotting import PlotModel
+    except ImportError:
+        return None
+    return SimpleNamespace(PlotBody=PlotBody, PlotFrame=PlotFrame, PlotLine=PlotLine,
+                           Circle3D=Circle3D, PlotModel=PlotModel)
+
+
+def plotting() -> SimpleNamespace:
+    """Return the plotting objects, skipping the test if symmeplot is missing."""
+    plot = _import_plotting()
+    if plot is None:
+        pytest.skip("symmeplot not installed")
+    return plot
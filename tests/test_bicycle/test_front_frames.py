@@ -10,12 +10,7 @@ from symbrim.bicycle.front_frames import (
 from symbrim.core import Attachment, Hub
 from symbrim.utilities.testing import _test_descriptions
 
-try:
-    from symmeplot.matplotlib import PlotBody, PlotLine
-
-    from symbrim.utilities.plotting import PlotModel
-except ImportError:
-    PlotModel = None
+from ._plotting import plotting
 
 
 class TestFrontFrame:
@@ -64,16 +59,17 @@ class TestFrontFrame:
             attachment.frame.dcm(front.system.frame)
             attachment.point.pos_from(front.system.fixed_point)
 
-    @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
     @pytest.mark.parametrize(("cls", "n_children"), [
         (RigidFrontFrameMoore, 2), (SuspensionRigidFrontFrameMoore, 2)])
+    @pytest.mark.plot
     def test_plotting(self, cls, n_children):
+        plot = plotting()
         front = cls("front")
         front.define_all()
-        plot_model = PlotModel(front.system.frame, front.system.fixed_point, front)
+        plot_model = plot.PlotModel(front.system.frame, front.system.fixed_point, front)
         assert len(plot_model.children) == n_children
-        assert any(isinstance(obj, PlotBody) for obj in plot_model.children)
-        assert any(isinstance(obj, PlotLine) for obj in plot_model.children)
+        assert any(isinstance(obj, plot.PlotBody) for obj in plot_model.children)
+        assert any(isinstance(obj, plot.PlotLine) for obj in plot_model.children)
 
 
 class TestRigidFrontFrameMoore:
@@ -87,11 +83,11 @@ class TestRigidFrontFrameMoore:
         front.define_objects()
         front.define_kinematics()
         # Test velocities
-        assert front.body.masscenter.vel(front.body.frame) == 0
-        assert front.steer_hub.point.vel(front.body.frame) == 0
-        assert front.wheel_hub.point.vel(front.body.frame) == 0
-        assert front.left_hand_grip.point.vel(front.body.frame) == 0
-        assert front.right_hand_grip.point.vel(front.body.frame) == 0
+        frame = front.body.frame
+        for point in (front.body.masscenter, front.steer_hub.point,
+                      front.wheel_hub.point, front.left_hand_grip.point,
+                      front.right_hand_grip.point):
+            assert point.vel(frame) == 0
 
 
 class TestSuspensionRigidFrontFrameMoore:
@@ -108,14 +104,14 @@ class TestSuspensionRigidFrontFrameMoore:
         front.define_objects()
         front.define_kinematics()
         # Test velocities
-        assert front.body.masscenter.vel(front.body.frame) == 0
-        assert front.steer_hub.point.vel(front.body.frame) == 0
-        assert front.suspension_stanchions.vel(front.body.frame) == 0
-        assert front.wheel_hub.point.vel(front.body.frame) == -front.u[0] * front.body.z
-        assert (front.suspension_lowers.vel(front.body.frame) ==
-                -front.u[0] * front.body.z)
-        assert front.left_hand_grip.point.vel(front.body.frame) == 0
-        assert front.right_hand_grip.point.vel(front.body.frame) == 0
+        frame = front.body.frame
+        for point in (front.body.masscenter, front.steer_hub.point,
+                      front.suspension_stanchions, front.left_hand_grip.point,
+                      front.right_hand_grip.point):
+            assert point.vel(frame) == 0
+        suspension_vel = -front.u[0] * front.body.z
+        assert front.wheel_hub.point.vel(frame) == suspension_vel
+        assert front.suspension_lowers.vel(frame) == suspension_vel
         assert front.wheel_hub.frame.ang_vel_in(front.steer_hub.frame) == Vector(0)
 
     def test_loads(self) -> None:
@@ -1,84 +1,86 @@
-from __future__ import annotations
-
 import pytest
 from sympy import Symbol
 from sympy.physics.mechanics import System, Vector
 
 from symbrim.bicycle.grounds import FlatGround
 
-try:
-    from symmeplot.matplotlib import PlotFrame
+from ._plotting import plotting
 
-    from symbrim.utilities.plotting import PlotModel
-except ImportError:
-    PlotModel = None
 
+@pytest.fixture(scope="module")
+def ground() -> FlatGround:
+    ground = FlatGround("ground")
+    ground.define_objects()
+    return ground
 
-class TestFlatGround:
-    @pytest.fixture
-    def _setup(self) -> None:
-        self.ground = FlatGround("ground")
-        self.ground.define_objects()
 
-    @pytest.mark.usefixtures("_setup")
-    def test_default(self) -> None:
-        assert self.ground.name == "ground"
-        assert self.ground.frame == self.ground.body.frame
-        assert self.ground.get_normal(self.ground.origin) == -self.ground.frame.z
-        assert self.ground.get_tangent_vectors(self.ground.origin) == (
-            self.ground.frame.x, self.ground.frame.y)
-        assert self.ground.origin == self.ground.body.masscenter
-        assert self.ground.origin.vel(self.ground.frame) == 0
-        assert isinstance(self.ground.system, System)
+class TestFlatGround:
+    def test_default(self, ground) -> None:
+        frame, origin = ground.frame, ground.origin
+        assert ground.name == "ground"
+        assert frame == ground.body.frame
+        assert ground.get_normal(origin) == -frame.z
+        assert ground.get_tangent_vectors(origin) == (frame.x, frame.y)
+        assert origin == ground.body.masscenter
+        assert origin.vel(frame) == 0
+        assert isinstance(ground.system, System)
 
-    @pytest.mark.parametrize(("normal", "n_idx", "pl_idx1", "pl_idx2"), [
+    NORMAL_CASES = (
         ("+x", 0, 1, 2),
         ("-x", 0, 1, 2),
+        ("x", 0, 1, 2),
         ("+y", 1, 0, 2),
         ("-y", 1, 0, 2),
+        ("y", 1, 0, 2),
         ("+z", 2, 0, 1),
         ("-z", 2, 0, 1),
-        ("x", 0, 1, 2),
-        ("y", 1, 0, 2),
         ("z", 2, 0, 1),
-    ])
-    def test_normal(self, normal: str, n_idx: int, pl_idx1: int, pl_idx2: int) -> None:
+    )
+
+    def test_normal(self) -> None:
+        for normal, n_idx, pl_idx1, pl_idx2 in self.NORMAL_CASES:
+            ground = FlatGround("ground", normal)
+            ground.define_objects()
+            vectors = (ground.frame.x, ground.frame.y, ground.frame.z)
+            times = -1 if normal[0] == "-" else 1
+            assert ground.get_normal(ground.origin) == times * vectors[n_idx], normal
+            assert ground.get_tangent_vectors(ground.origin) == (
+                vectors[pl_idx1], vectors[pl_idx2]), normal
+
+    @pytest.mark.parametrize("normal", ["xy", "-yz", "+", "-", "w"])
+    def test_invalid_normal(self, normal) -> None:
         ground = FlatGround("ground", normal)
-        ground.define_objects()
-        vectors = (ground.frame.x, ground.frame.y, ground.frame.z)
-        times = -1 if normal[0] == "-" else 1
-        assert ground.get_normal(ground.origin) == times * vectors[n_idx]
-        assert ground.get_tangent_vectors(ground.origin) == (
-            vectors[pl_idx1], vectors[pl_idx2])
+        with pytest.raises(ValueError):
+            ground.define_objects()
 
     @pytest.mark.parametrize("tp", ["tuple", "vector", "point"])
     @pytest.mark.parametrize(("position", "expected"), [
         ((Symbol("x"), Symbol("y"), Symbol("z")),
          (Symbol("x"), Symbol("y"), Symbol("z"))),
         ((Symbol("x"), Symbol("y")), (Symbol("x"), Symbol("y"), 0))])
-    @pytest.mark.usefixtures("_setup")
-    def test_parse_plane_position(self, tp, position, expected) -> None:
+    def test_parse_plane_position(self, ground, tp, position, expected) -> None:
         if tp in ("vector", "point"):
             position = Vector(0)
             for i, v in enumerate("xyz"):
                 if i < len(expected):
-                    position += expected[i] * self.ground.frame[v]
+                    position += expected[i] * ground.frame[v]
         if tp == "point":
-            position = self.ground.origin.locatenew("p", position)
-        assert self.ground._parse_plane_position(position) == expected
+            position = ground.origin.locatenew("p", position)
+        assert ground._parse_plane_position(position) == expected
 
     @pytest.mark.parametrize("position", [
         (Symbol("x"), Symbol("y"), Symbol("z"), Symbol("w")),
         (Symbol("x"), )])
-    @pytest.mark.usefixtures("_setup")
-    def test_parse_plane_position_error(self, position) -> None:
+    def test_parse_plane_position_error(self, ground, position) -> None:
         with pytest.raises(ValueError):
-            self.ground._parse_plane_position(position)
+            ground._parse_plane_position(position)
 
-    @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self):
+        plot = plotting()
         ground = FlatGround("ground")
         ground.define_all()
-        plot_model = PlotModel(ground.system.frame, ground.system.fixed_point, ground)
+        plot_model = plot.PlotModel(ground.system.frame, ground.system.fixed_point,
+                                    ground)
         assert len(plot_model.children) == 1
-        assert isinstance(plot_model.children[0], PlotFrame)
+        assert isinstance(plot_model.children[0], plot.PlotFrame)
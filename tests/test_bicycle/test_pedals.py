@@ -1,52 +1,46 @@
-from __future__ import annotations
-
 import pytest
 from sympy.physics.mechanics import Point, ReferenceFrame, Vector
 
 from symbrim.bicycle import CranksBase, MasslessCranks
 from symbrim.utilities.testing import _test_descriptions
+from symbrim.utilities.utilities import check_zero
 
-try:
-    from symmeplot.matplotlib import PlotLine
+from ._plotting import plotting
 
-    from symbrim.utilities.plotting import PlotModel
-except ImportError:
-    PlotModel = None
 
+@pytest.fixture(scope="module")
+def cranks() -> MasslessCranks:
+    cranks = MasslessCranks("cranks")
+    cranks.define_all()
+    return cranks
 
-@pytest.mark.parametrize("cranks_cls", [MasslessCranks])
-class TestCranksBase:
-    @pytest.fixture(autouse=True)
-    def _setup(self, cranks_cls) -> None:
-        self.cranks = cranks_cls("cranks")
-        self.cranks.define_all()
 
-    def test_types(self) -> None:
-        assert isinstance(self.cranks, CranksBase)
-        assert isinstance(self.cranks.frame, ReferenceFrame)
-        assert isinstance(self.cranks.center_point, Point)
-        assert isinstance(self.cranks.left_pedal_point, Point)
-        assert isinstance(self.cranks.right_pedal_point, Point)
-        assert isinstance(self.cranks.rotation_axis, Vector)
+class TestCranksBase:
+    def test_types(self, cranks) -> None:
+        assert isinstance(cranks, CranksBase)
+        assert isinstance(cranks.frame, ReferenceFrame)
+        assert isinstance(cranks.center_point, Point)
+        assert isinstance(cranks.left_pedal_point, Point)
+        assert isinstance(cranks.right_pedal_point, Point)
+        assert isinstance(cranks.rotation_axis, Vector)
 
-    def test_descriptions(self) -> None:
-        _test_descriptions(self.cranks)
+    @pytest.mark.parametrize("cranks_cls", [MasslessCranks])
+    def test_descriptions(self, cranks_cls) -> None:
+        _test_descriptions(cranks_cls("cranks"))
 
 
 class TestMasslessCranks:
-    def test_kinematics(self) -> None:
-        cranks = MasslessCranks("cranks")
-        cranks.define_all()
-        assert cranks.rotation_axis == cranks.frame.y
-        assert cranks.right_pedal_point.pos_from(cranks.left_pedal_point).dot(
-            cranks.rotation_axis) == 2 * cranks.symbols["offset"]
-        assert cranks.right_pedal_point.pos_from(cranks.left_pedal_point).dot(
-            cranks.frame.x) == 2 * cranks.symbols["radius"]
-
-    @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
-    def test_plotting(self):
-        cranks = MasslessCranks("cranks")
-        cranks.define_all()
-        plot_model = PlotModel(cranks.system.frame, cranks.system.fixed_point, cranks)
+    def test_kinematics(self, cranks) -> None:
+        axis, frame = cranks.rotation_axis, cranks.frame
+        pedal_offset = cranks.right_pedal_point.pos_from(cranks.left_pedal_point)
+        assert axis == frame.y
+        assert check_zero(pedal_offset.dot(axis) - 2 * cranks.symbols["offset"])
+        assert check_zero(pedal_offset.dot(frame.x) - 2 * cranks.symbols["radius"])
+
+    @pytest.mark.plot
+    def test_plotting(self, cranks):
+        plot = plotting()
+        plot_model = plot.PlotModel(cranks.system.frame, cranks.system.fixed_point,
+                                    cranks)
         assert len(plot_model.children) == 1
-        assert isinstance(plot_model.children[0], PlotLine)
+        assert isinstance(plot_model.children[0], plot.PlotLine)
@@ -5,12 +5,15 @@ from symbrim.bicycle.rear_frames import RigidRearFrame, RigidRearFrameMoore
 from symbrim.core import Attachment, Hub
 from symbrim.utilities.testing import _test_descriptions
 
-try:
-    from symmeplot.matplotlib import PlotBody, PlotLine
+from ._plotting import plotting
 
-    from symbrim.utilities.plotting import PlotModel
-except ImportError:
-    PlotModel = None
+
+@pytest.fixture(scope="module")
+def rear_moore() -> RigidRearFrameMoore:
+    rear = RigidRearFrameMoore("rear")
+    rear.define_objects()
+    rear.define_kinematics()
+    return rear
 
 
 class TestRigidRearFrame:
@@ -55,31 +58,29 @@ class TestRigidRearFrame:
             attachment.point.pos_from(rear.system.fixed_point)
         rear.bottom_bracket.pos_from(rear.system.fixed_point)
 
-    @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
     @pytest.mark.parametrize(("cls", "n_children"), [(RigidRearFrameMoore, 2)])
+    @pytest.mark.plot
     def test_plotting(self, cls, n_children):
+        plot = plotting()
         rear = cls("rear")
         rear.define_all()
-        plot_model = PlotModel(rear.system.frame, rear.system.fixed_point, rear)
+        plot_model = plot.PlotModel(rear.system.frame, rear.system.fixed_point, rear)
         assert len(plot_model.children) == n_children
-        assert any(isinstance(obj, PlotBody) for obj in plot_model.children)
-        assert any(isinstance(obj, PlotLine) for obj in plot_model.children)
+        assert any(isinstance(obj, plot.PlotBody) for obj in plot_model.children)
+        assert any(isinstance(obj, plot.PlotLine) for obj in plot_model.children)
 
 
 class TestRigidRearFrameMoore:
-    def test_default(self):
-        rear = RigidRearFrameMoore("rear")
-        rear.define_objects()
-        rear.define_kinematics()
+    def test_default(self, rear_moore):
+        rear = rear_moore
         assert rear.wheel_hub.axis == rear.body.y
 
-    def test_kinematics(self):
-        rear = RigidRearFrameMoore("rear")
-        rear.define_objects()
-        rear.define_kinematics()
+    def test_kinematics(self, rear_moore):
+        rear = rear_moore
         # Test velocities
-        assert rear.body.masscenter.vel(rear.body.frame) == 0
-        assert rear.steer_hub.point.vel(rear.body.frame) == 0
-        assert rear.wheel_hub.point.vel(rear.body.frame) == 0
-        assert rear.saddle.point.vel(rear.body.frame) == 0
-        assert rear.bottom_bracket.vel(rear.body.frame) == 0
+        frame = rear.body.frame
+        assert rear.body.masscenter.vel(frame) == 0
+        assert rear.steer_hub.point.vel(frame) == 0
+        assert rear.wheel_hub.point.vel(frame) == 0
+        assert rear.saddle.point.vel(frame) == 0
+        assert rear.bottom_bracket.vel(frame) == 0
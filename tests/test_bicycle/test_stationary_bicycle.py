@@ -10,6 +10,29 @@ from symbrim.bicycle import (
 )
 
 
+@pytest.fixture(scope="module")
+def bike_default() -> StationaryBicycle:
+    bike = StationaryBicycle("bicycle")
+    bike.rear_frame = RigidRearFrame("rear_frame")
+    bike.define_all()
+    return bike
+
+
+@pytest.fixture(scope="module", params=[
+    ("front_frame", RigidFrontFrame, (1,)),
+    ("rear_wheel", KnifeEdgeWheel, (0,)),
+    ("cranks", MasslessCranks, (0,)),
+    ("rear_wheel", ToroidalWheel, (0,)),
+], ids=["front_frame", "knife_edge_wheel", "cranks", "toroidal_wheel"])
+def bike_optional(request) -> tuple[tuple[int, ...], StationaryBicycle]:
+    name, model_cls, coord_idx = request.param
+    bike = StationaryBicycle("bicycle")
+    bike.rear_frame = RigidRearFrame("rear_frame")
+    setattr(bike, name, model_cls(name))
+    bike.define_all()
+    return coord_idx, bike
+
+
 class TestStationaryBicycle:
     @pytest.fixture
     def _setup_default(self) -> None:
@@ -25,24 +48,15 @@ class TestStationaryBicycle:
         assert bicycle.rear_wheel is None
         assert bicycle.cranks is None
 
-    @pytest.mark.usefixtures("_setup_default")
-    def test_only_rear_frame_hard(self):
-        self.bike.define_all()
+    def test_only_rear_frame_hard(self, bike_default):
+        assert bike_default.rear_frame.system is not None
 
-    @pytest.mark.parametrize(("name", "model_cls", "coord_idx"), [
-        ("front_frame", RigidFrontFrame, (1,)),
-        ("rear_wheel", KnifeEdgeWheel, (0,)),
-        ("cranks", MasslessCranks, (0,)),
-        ("rear_wheel", ToroidalWheel, (0,)),
-    ])
-    @pytest.mark.usefixtures("_setup_default")
-    def test_optional_models(self, name, model_cls, coord_idx):
-        setattr(self.bike, name, model_cls(name))
-        self.bike.define_all()
+    def test_optional_models(self, bike_optional):
+        coord_idx, bike = bike_optional
         for idx in coord_idx:
-            assert self.bike.q[idx] in self.bike.system.q
-            assert self.bike.u[idx] in self.bike.system.u
-            assert len(self.bike.system.kdes) == len(coord_idx)
+            assert bike.q[idx] in bike.system.q
+            assert bike.u[idx] in bike.system.u
+            assert len(bike.system.kdes) == len(coord_idx)
 
     @pytest.mark.usefixtures("_setup_default")
     def test_front_wheel(self):
@@ -64,13 +78,8 @@ class TestStationaryBicycle:
             assert ui in self.bike.system.u
         assert len(self.bike.system.kdes) == 3
 
-    @pytest.mark.usefixtures("_setup_default")
-    def test_descriptions(self) -> None:
-        self.bike.define_connections()
-        self.bike.define_objects()
-        for sym in self.bike.symbols.values():
-            assert self.bike.descriptions[sym]
-        for qi in self.bike.q:
-            assert self.bike.descriptions[qi]
-        for ui in self.bike.u:
-            assert self.bike.descriptions[ui]
+    def test_descriptions(self, bike_default) -> None:
+        described = {sym for sym, desc in bike_default.descriptions.items() if desc}
+        missing = {*bike_default.symbols.values(), *bike_default.q,
+                   *bike_default.u} - described
+        assert not missing, f"missing descriptions: {missing}"
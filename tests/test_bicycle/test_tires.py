@@ -1,28 +1,57 @@
-from __future__ import annotations
-
 import pytest
-from sympy import Matrix, S, cos, linear_eq_to_matrix, pi, simplify, sin, symbols
+from sympy import Expr, Matrix, S, cos, linear_eq_to_matrix, pi, sin, symbols
 from sympy.physics.mechanics import ReferenceFrame, System, cross, dynamicsymbols
 
 from symbrim.bicycle.grounds import FlatGround, GroundBase
 from symbrim.bicycle.tires import InContactTire, NonHolonomicTire, TireBase
 from symbrim.bicycle.wheels import KnifeEdgeWheel, ToroidalWheel, WheelBase
+from symbrim.core import ModelBase
 from symbrim.other.rolling_disc import RollingDisc
 from symbrim.utilities.testing import _test_descriptions, create_model_of_connection
 from symbrim.utilities.utilities import check_zero
 
+q = dynamicsymbols("q1:4")
+
 
 class MyTire(TireBase):
     pass
 
 
+class NewGround(GroundBase):
+    def get_normal(self, position):
+        return -self.body.z
+
+    def get_tangent_vectors(self, position):
+        return (self.frame.x, self.frame.y)
+
+    def set_pos_point(self, point, position) -> None:
+        point.set_pos(self.origin, position[0] * self.frame.x +
+                      position[1] * self.frame.y)
+
+
+class NewWheel(WheelBase):
+    @property
+    def center(self):
+        return self.body.masscenter
+
+    def rotation_axis(self):
+        return self.frame.y
+
+
+@pytest.fixture
+def flat_ground() -> FlatGround:
+    # Each test links its own frames and points to the ground, so it is not shared.
+    ground = FlatGround("ground")
+    ground.define_objects()
+    ground.define_kinematics()
+    return ground
+
+
 class TestTireBase:
     @pytest.fixture
-    def _setup_flat_ground(self):
-        self.ground = FlatGround("ground")
-        self.ground.define_objects()
-        self.ground.define_kinematics()
-        self.q = dynamicsymbols("q1:4")
+    def _setup_flat_ground(self, flat_ground):
+        self.ground = flat_ground
+        self.q = q
         self.yaw_frame = ReferenceFrame("yaw_frame")
         self.yaw_frame.orient_axis(self.ground.frame, self.q[0], self.ground.frame.z)
         self.roll_frame = ReferenceFrame("roll_frame")
@@ -42,11 +71,11 @@ class TestTireBase:
     @pytest.mark.usefixtures("_setup_knife_edge_wheel")
     def test_knife_edge_wheel_on_flat_ground(self):
         self.tire._set_pos_contact_point()
-        assert (self.tire.contact_point.pos_from(self.wheel.center) -
-                self.wheel.symbols["r"] * self.roll_frame.z).express(
-                    self.wheel.frame).simplify().xreplace(
-                        {self.q[1]: 0.123, self.q[2]: 1.234}) == 0
-        # sqrt(cos(q2)**2) is not simplified  # noqa: ERA001
+        residual = (self.tire.contact_point.pos_from(self.wheel.center) -
+                    self.wheel.symbols["r"] * self.roll_frame.z)
+        for component in residual.to_matrix(self.wheel.frame).xreplace(
+                {self.q[1]: 0.123, self.q[2]: 1.234}):
+            assert check_zero(component)
 
     @pytest.mark.usefixtures("_setup_flat_ground")
     def test_toroidal_wheel_on_flat_ground(self) -> None:
@@ -56,52 +85,33 @@ class TestTireBase:
         self.tire.wheel = wheel
         wheel.frame.orient_axis(self.roll_frame, self.q[2], self.roll_frame.y)
         self.tire._set_pos_contact_point()
-        assert (self.tire.contact_point.pos_from(wheel.center) -
-                wheel.symbols["r"] * self.roll_frame.z + wheel.symbols["tr"] *
-                self.ground.get_normal(self.tire.contact_point)).express(
-            wheel.frame).simplify().xreplace({self.q[1]: 0.123, self.q[2]: 1.234}) == 0
-        # sqrt(cos(q2)**2) is not simplified  # noqa: ERA001
-
-    def test_not_implemented_combinations(self) -> None:
-        class NewGround(GroundBase):
-            def get_normal(self, position):
-                return -self.body.z
-
-            def get_tangent_vectors(self, position):
-                return (self.frame.x, self.frame.y)
-
-            def set_pos_point(self, point, position) -> None:
-                point.set_pos(self.origin, position[0] * self.frame.x +
-                              position[1] * self.frame.y)
-
-        class NewWheel(WheelBase):
-            @property
-            def center(self):
-                return self.body.masscenter
-
-            def rotation_axis(self):
-                return self.frame.y
-
-        for wheel_cls, ground_cls in [(KnifeEdgeWheel, NewGround),
-                                      (NewWheel, FlatGround),
-                                      (NewWheel, NewGround)]:
-            tire = MyTire("tire")
-            tire.ground = ground_cls("ground")
-            tire.wheel = wheel_cls("wheel")
-            tire.ground.define_objects()
-            tire.wheel.define_objects()
-            tire.define_objects()
-            tire.ground.define_kinematics()
-            tire.wheel.define_kinematics()
-            with pytest.raises(NotImplementedError):
-                tire._set_pos_contact_point()
+        residual = (self.tire.contact_point.pos_from(wheel.center) -
+                    wheel.symbols["r"] * self.roll_frame.z + wheel.symbols["tr"] *
+                    self.ground.get_normal(self.tire.contact_point))
+        for component in residual.to_matrix(wheel.frame).xreplace(
+                {self.q[1]: 0.123, self.q[2]: 1.234}):
+            assert check_zero(component)
+
+    @pytest.mark.parametrize(("wheel_cls", "ground_cls"), [
+        (KnifeEdgeWheel, NewGround), (NewWheel, FlatGround), (NewWheel, NewGround)])
+    def test_not_implemented_combinations(self, wheel_cls, ground_cls) -> None:
+        tire = MyTire("tire")
+        tire.ground = ground_cls("ground")
+        tire.wheel = wheel_cls("wheel")
+        tire.ground.define_objects()
+        tire.wheel.define_objects()
+        tire.define_objects()
+        tire.ground.define_kinematics()
+        tire.wheel.define_kinematics()
+        with pytest.raises(NotImplementedError):
+            tire._set_pos_contact_point()
 
     @pytest.mark.usefixtures("_setup_knife_edge_wheel")
     def test_upward_radial_axis(self):
         self.tire.upward_radial_axis = -self.roll_frame.z
         self.tire._set_pos_contact_point()
         assert (self.tire.contact_point.pos_from(self.wheel.center) -
-                self.wheel.symbols["r"] * self.roll_frame.z).simplify() == 0
+                self.wheel.symbols["r"] * self.roll_frame.z) == 0
 
     @pytest.mark.usefixtures("_setup_knife_edge_wheel")
     def test_upward_radial_axis_invalid(self):
@@ -180,7 +190,7 @@ class TestTireBase:
         self.tire._set_pos_contact_point()
         self.tire.contact_point.set_pos(
             self.ground.origin,
-            int(off_ground) * dynamicsymbols("q3") * self.ground.frame.z)
+            int(off_ground) * self.q[2] * self.ground.frame.z)
         assert self.tire.on_ground != off_ground
 
 
@@ -285,7 +295,7 @@ class TestInContactTire:
         m, r = self.model.wheel.body.mass, self.model.wheel.radius
         q4, u4 = self.model.q[3], self.model.u[3]
         fn_eq_expected = m * (g - r * (u4 ** 2 * cos(q4) + sin(q4) * u4.diff()))
-        assert simplify(fn_eq - fn_eq_expected) == 0
+        assert (fn_eq - fn_eq_expected).expand() == 0
 
     @pytest.mark.parametrize(("load_str", "location", "direction"), [
         ("Fx", "self.tire.contact_point", "self.tire.longitudinal_axis"),
@@ -347,46 +357,56 @@ class TestInContactTire:
             assert (self.tire.symbols["Fz"] in load.vector.free_dynamicsymbols(
                 self.wheel.frame)) == substitute_loads
 
-class TestNonHolonomicTire:
-    @pytest.fixture(autouse=True)
-    def _setup(self) -> None:
-        self.model = create_model_of_connection(NonHolonomicTire)("model")
-        self.model.ground = FlatGround("ground")
-        self.model.wheel = KnifeEdgeWheel("wheel")
-        self.model.conn = NonHolonomicTire("tire_model")
+def _create_nonholonomic_tire_model() -> ModelBase:
+    model = create_model_of_connection(NonHolonomicTire)("model")
+    model.ground = FlatGround("ground")
+    model.wheel = KnifeEdgeWheel("wheel")
+    model.conn = NonHolonomicTire("tire_model")
+    model.define_connections()
+    model.define_objects()
+    return model
+
+
+@pytest.fixture(scope="module", params=[True, False], ids=["on_ground", "off_ground"])
+def nonholonomic_tire_model(request) -> tuple[ModelBase, dict[Expr, Expr], Expr]:
+    model = _create_nonholonomic_tire_model()
+    model.conn.on_ground = request.param
+    ground, wheel, tire_model = model.ground, model.wheel, model.conn
+    t = dynamicsymbols._t
+    q1, q2, x, y, z = dynamicsymbols("q1 q2 x y z")
+    wheel.frame.orient_body_fixed(ground.frame, (q1, q2, 0), "zyx")
+    ground.set_pos_point(tire_model.contact_point, (x, y))
+    if not request.param:
+        tire_model.contact_point.set_pos(
+            ground.origin, tire_model.contact_point.pos_from(
+                ground.origin) + z * ground.get_normal(tire_model.contact_point))
+    model.define_kinematics()
+    model.define_loads()
+    model.define_constraints()
+    # Expected nonholonomic constraints keyed by the ground speed they constrain.
+    fnh = {
+        x.diff(t): wheel.radius * cos(q1) * q2.diff(t) + x.diff(t),
+        y.diff(t): wheel.radius * sin(q1) * q2.diff(t) + y.diff(t),
+    }
+    return model, fnh, z
 
-    def test_default(self) -> None:
-        self.model.define_connections()
-        self.model.define_objects()
-        assert self.model.conn.name == "tire_model"
-        assert isinstance(self.model.conn.system, System)
 
-    @pytest.mark.parametrize("on_ground", [True, False])
-    def test_compute_on_ground(self, on_ground: bool) -> None:
-        self.model.define_connections()
-        self.model.define_objects()
-        self.model.conn.on_ground = on_ground
-        ground, wheel, tire_model = (
-            self.model.ground, self.model.wheel, self.model.conn)
-        t = dynamicsymbols._t
-        q1, q2, x, y, z = dynamicsymbols("q1 q2 x y z")
-        wheel.frame.orient_body_fixed(ground.frame, (q1, q2, 0), "zyx")
-        ground.set_pos_point(tire_model.contact_point, (x, y))
-        if not on_ground:
-            tire_model.contact_point.set_pos(
-                ground.origin, tire_model.contact_point.pos_from(
-                    ground.origin) + z * ground.get_normal(tire_model.contact_point))
-        self.model.define_kinematics()
-        self.model.define_loads()
-        self.model.define_constraints()
-        fnh = [
-            wheel.radius * cos(q1) * q2.diff(t) + x.diff(t),
-            wheel.radius * sin(q1) * q2.diff(t) + y.diff(t),
-        ]
+class TestNonHolonomicTire:
+    def test_default(self) -> None:
+        model = _create_nonholonomic_tire_model()
+        assert model.conn.name == "tire_model"
+        assert isinstance(model.conn.system, System)
+
+    def test_compute_on_ground(self, nonholonomic_tire_model) -> None:
+        model, fnh, z = nonholonomic_tire_model
+        tire_model = model.conn
+        on_ground = tire_model.on_ground
         assert len(tire_model.system.holonomic_constraints) == int(not on_ground)
         assert len(tire_model.system.nonholonomic_constraints) == 2
         if not on_ground:
-            assert (tire_model.system.holonomic_constraints[0] - z
-                    ).simplify() == 0
-        for fnhi in tire_model.system.nonholonomic_constraints:
-            assert (fnhi - fnh[0]).simplify() == 0 or (fnhi - fnh[1]).simplify() == 0
+            assert check_zero(tire_model.system.holonomic_constraints[0] - z)
+        fnh_sys = tire_model.system.nonholonomic_constraints
+        speeds = [next(speed for speed in fnh if fnhi.has(speed)) for fnhi in fnh_sys]
+        assert set(speeds) == set(fnh)
+        for fnhi, speed in zip(fnh_sys, speeds):
+            assert check_zero(fnhi - fnh[speed])
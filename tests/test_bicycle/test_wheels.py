@@ -1,26 +1,28 @@
-from __future__ import annotations
-
 import pytest
 
-from symbrim.bicycle.wheels import KnifeEdgeWheel, ToroidalWheel
+from symbrim.bicycle.wheels import KnifeEdgeWheel, ToroidalWheel, WheelBase
+
+from ._plotting import plotting
+
+
+def _create_wheel(wheel_cls: type[WheelBase]) -> WheelBase:
+    wheel = wheel_cls("wheel")
+    wheel.define_all()
+    return wheel
 
-try:
-    from symmeplot.matplotlib import PlotBody
-    from symmeplot.matplotlib.artists import Circle3D
 
-    from symbrim.utilities.plotting import PlotModel
-except ImportError:
-    PlotModel = None
+@pytest.fixture(scope="module", params=[KnifeEdgeWheel, ToroidalWheel])
+def wheel(request) -> WheelBase:
+    return _create_wheel(request.param)
+
+
+@pytest.fixture(scope="module")
+def knife_edge_wheel() -> KnifeEdgeWheel:
+    return _create_wheel(KnifeEdgeWheel)
 
 
 class TestWheelsGeneral:
-    @pytest.mark.parametrize("wheel", [KnifeEdgeWheel("wheel"), ToroidalWheel("wheel")])
     def test_default(self, wheel) -> None:
-        wheel.define_connections()
-        wheel.define_objects()
-        wheel.define_kinematics()
-        wheel.define_loads()
-        wheel.define_constraints()
         assert wheel.name == "wheel"
         assert wheel.frame == wheel.body.frame
         assert wheel.center == wheel.body.masscenter
@@ -28,25 +30,23 @@ class TestWheelsGeneral:
 
 
 class TestKnifeEdgeWheel:
-    def test_descriptions(self) -> None:
-        wheel = KnifeEdgeWheel("wheel")
-        wheel.define_objects()
+    def test_descriptions(self, knife_edge_wheel) -> None:
+        wheel = knife_edge_wheel
         assert wheel.descriptions[wheel.radius] is not None
 
-    @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
-    def test_plotting(self):
-        wheel = KnifeEdgeWheel("wheel")
-        wheel.define_all()
+    @pytest.mark.plot
+    def test_plotting(self, knife_edge_wheel):
+        plot = plotting()
+        wheel = knife_edge_wheel
 
-        plot_model = PlotModel(wheel.system.frame, wheel.system.fixed_point, wheel)
+        plot_model = plot.PlotModel(wheel.system.frame, wheel.system.fixed_point, wheel)
         assert len(plot_model.children) == 1
-        assert isinstance(plot_model.children[0], PlotBody)
-        assert any(isinstance(art, Circle3D) for art in plot_model.artists)
+        assert isinstance(plot_model.children[0], plot.PlotBody)
+        assert any(isinstance(art, plot.Circle3D) for art in plot_model.artists)
 
 
 class TestToroidalWheel:
     def test_descriptions(self) -> None:
-        wheel = ToroidalWheel("wheel")
-        wheel.define_objects()
+        wheel = _create_wheel(ToroidalWheel)
         assert wheel.descriptions[wheel.radius] is not None
         assert wheel.descriptions[wheel.transverse_radius] is not None
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
 import numpy as np
 import pytest
-from sympy import Matrix, Symbol, count_ops, lambdify, linear_eq_to_matrix
-from sympy.physics.mechanics import dynamicsymbols, msubs
+from sympy import Matrix, Symbol, count_ops, cse, linear_eq_to_matrix
+from sympy.physics.mechanics import dynamicsymbols
 
 from symbrim import (
     FlatGround,
@@ -16,9 +17,86 @@ from symbrim import (
 )
 from symbrim.bicycle import MasslessCranks, WhippleBicycle, WhippleBicycleMoore
 from symbrim.utilities.testing import ignore_point_warnings
+from symbrim.utilities.utilities import _lambdify
 
 if TYPE_CHECKING:
     from sympy import Basic
+    from sympy.physics.mechanics import System
+
+
+def _create_default_bike() -> WhippleBicycleMoore:
+    bike = WhippleBicycleMoore("bike")
+    bike.ground = FlatGround("ground")
+    bike.rear_frame = RigidRearFrame("rear_frame")
+    bike.front_frame = RigidFrontFrame("front_frame")
+    bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
+    bike.front_wheel = KnifeEdgeWheel("front_wheel")
+    bike.rear_tire = NonHolonomicTire("rear_tire")
+    bike.front_tire = NonHolonomicTire("front_tire")
+    return bike
+
+
+def _form_eoms(compute_rear: bool, compute_front: bool
+               ) -> tuple[WhippleBicycleMoore, System]:
+    """Form the equations of motion of the default bicycle."""
+    bike = _create_default_bike()
+    bike.rear_tire.compute_normal_force = compute_rear
+    bike.front_tire.compute_normal_force = compute_front
+    bike.define_all()
+    system = bike.to_system()
+    system.apply_uniform_gravity(
+        -Symbol("g") * bike.ground.get_normal(bike.ground.origin))
+    system.q_ind = [*bike.q[:4], *bike.q[5:]]
+    system.q_dep = [bike.q[4]]
+    system.u_ind = [bike.u[3], *bike.u[5:7]]
+    system.u_dep = [*bike.u[:3], bike.u[4], bike.u[7]]
+    with ignore_point_warnings():
+        system.form_eoms(constraint_solver="CRAMER")
+    return bike, system
+
+
+def _get_basu_mandal_values(bike: WhippleBicycleMoore
+                            ) -> tuple[dict[Basic, float], dict[Basic, float]]:
+    """Get the Basu-Mandal benchmark constants and initial state of the bicycle."""
+    i_rw, i_fw, i_rf, i_ff = (
+        model.body.central_inertia.to_matrix(model.body.frame) for model in (
+            bike.rear_wheel, bike.front_wheel, bike.rear_frame, bike.front_frame))
+    constants = {
+        bike.front_wheel.symbols["r"]: 0.35,
+        bike.rear_wheel.symbols["r"]: 0.3,
+        bike.rear_frame.symbols["d1"]: 0.9534570696121849,
+        bike.front_frame.symbols["d2"]: 0.2676445084476887,
+        bike.front_frame.symbols["d3"]: 0.03207142672761929,
+        bike.rear_frame.symbols["l1"]: 0.4707271515135145,
+        bike.rear_frame.symbols["l2"]: -0.47792881146460797,
+        bike.front_frame.symbols["l3"]: -0.00597083392418685,
+        bike.front_frame.symbols["l4"]: -0.3699518200282974,
+        bike.rear_frame.body.mass: 85.0,
+        bike.rear_wheel.body.mass: 2.0,
+        bike.front_frame.body.mass: 4.0,
+        bike.front_wheel.body.mass: 3.0,
+        i_rw[0, 0]: 0.0603,
+        i_rw[1, 1]: 0.12,
+        i_fw[0, 0]: 0.1405,
+        i_fw[1, 1]: 0.28,
+        i_rf[0, 0]: 7.178169776497895,
+        i_rf[1, 1]: 11.0,
+        i_rf[0, 2]: 3.8225535938357873,
+        i_rf[2, 2]: 4.821830223502103,
+        i_ff[0, 0]: 0.05841337700152972,
+        i_ff[1, 1]: 0.06,
+        i_ff[0, 2]: 0.009119225261946298,
+        i_ff[2, 2]: 0.007586622998470264,
+        Symbol("g"): 9.81}
+    initial_state = {
+        **dict(zip(bike.q, (
+            -0.0, -0.17447337661787718, -0.0, 0.6206670416476966,
+            0.3300446174593725, -0.0, -0.2311385135743, -0.0))),
+        **dict(zip(bike.u, (
+            2.6703213326046784, -2.453592884421596e-14, -0.7830033527065,
+            -0.6068425835418, 0.0119185528069, -8.912989661489, -0.4859824687093,
+            -8.0133620584155)))}
+    return constants, initial_state
 
 
 class TestWhippleBicycle:
@@ -39,88 +117,30 @@ class TestWhippleBicycle:
 
 
 class TestWhippleBicycleMoore:
-    @staticmethod
-    def _get_basu_mandal_values(bike: WhippleBicycleMoore
-                                ) -> tuple[dict[Basic, float], dict[Basic, float]]:
-        def get_inertia_matrix(model):
-            return model.body.central_inertia.to_matrix(model.body.frame)
-
-        constants = {
-            bike.front_wheel.symbols["r"]: 0.35,
-            bike.rear_wheel.symbols["r"]: 0.3,
-            bike.rear_frame.symbols["d1"]: 0.9534570696121849,
-            bike.front_frame.symbols["d2"]: 0.2676445084476887,
-            bike.front_frame.symbols["d3"]: 0.03207142672761929,
-            bike.rear_frame.symbols["l1"]: 0.4707271515135145,
-            bike.rear_frame.symbols["l2"]: -0.47792881146460797,
-            bike.front_frame.symbols["l3"]: -0.00597083392418685,
-            bike.front_frame.symbols["l4"]: -0.3699518200282974,
-            bike.rear_frame.body.mass: 85.0,
-            bike.rear_wheel.body.mass: 2.0,
-            bike.front_frame.body.mass: 4.0,
-            bike.front_wheel.body.mass: 3.0,
-            get_inertia_matrix(bike.rear_wheel)[0, 0]: 0.0603,
-            get_inertia_matrix(bike.rear_wheel)[1, 1]: 0.12,
-            get_inertia_matrix(bike.front_wheel)[0, 0]: 0.1405,
-            get_inertia_matrix(bike.front_wheel)[1, 1]: 0.28,
-            get_inertia_matrix(bike.rear_frame)[0, 0]: 7.178169776497895,
-            get_inertia_matrix(bike.rear_frame)[1, 1]: 11.0,
-            get_inertia_matrix(bike.rear_frame)[0, 2]: 3.8225535938357873,
-            get_inertia_matrix(bike.rear_frame)[2, 2]: 4.821830223502103,
-            get_inertia_matrix(bike.front_frame)[0, 0]: 0.05841337700152972,
-            get_inertia_matrix(bike.front_frame)[1, 1]: 0.06,
-            get_inertia_matrix(bike.front_frame)[0, 2]: 0.009119225261946298,
-            get_inertia_matrix(bike.front_frame)[2, 2]: 0.007586622998470264,
-            Symbol("g"): 9.81}
-        initial_state = {
-            **dict(zip(bike.q, (
-                -0.0, -0.17447337661787718, -0.0, 0.6206670416476966,
-                0.3300446174593725, -0.0, -0.2311385135743, -0.0))),
-            **dict(zip(bike.u, (
-                2.6703213326046784, -2.453592884421596e-14, -0.7830033527065,
-                -0.6068425835418, 0.0119185528069, -8.912989661489, -0.4859824687093,
-                -8.0133620584155)))}
-        return constants, initial_state
-
     @pytest.fixture
     def _setup_default(self) -> None:
-        self.bike = WhippleBicycleMoore("bike")
-        self.bike.ground = FlatGround("ground")
-        self.bike.rear_frame = RigidRearFrame("rear_frame")
-        self.bike.front_frame = RigidFrontFrame("front_frame")
-        self.bike.rear_wheel = KnifeEdgeWheel("rear_wheel")
-        self.bike.front_wheel = KnifeEdgeWheel("front_wheel")
-        self.bike.rear_tire = NonHolonomicTire("rear_tire")
-        self.bike.front_tire = NonHolonomicTire("front_tire")
+        self.bike = _create_default_bike()
 
     @pytest.mark.slow
-    @pytest.mark.usefixtures("_setup_default")
     def test_basu_mandal(self) -> None:
         t = dynamicsymbols._t
-        self.bike.define_all()
-        system = self.bike.to_system()
-        system.apply_uniform_gravity(-Symbol("g") * self.bike.ground.get_normal(
-            self.bike.ground.origin))
-        system.q_ind = [*self.bike.q[:4], *self.bike.q[5:]]
-        system.q_dep = [self.bike.q[4]]
-        system.u_ind = [self.bike.u[3], *self.bike.u[5:7]]
-        system.u_dep = [*self.bike.u[:3], self.bike.u[4], self.bike.u[7]]
-        with ignore_point_warnings():
-            system.form_eoms(constraint_solver="CRAMER")
-
-        constants, initial_state = self._get_basu_mandal_values(self.bike)
+        bike, system = _form_eoms(compute_rear=False, compute_front=False)
+        constants, initial_state = _get_basu_mandal_values(bike)
         p, p_vals = zip(*constants.items())
-        q0 = [initial_state[qi] for qi in system.q]
-        u0 = [initial_state[ui] for ui in system.u]
-        eval_sys = lambdify((system.q, system.u, p),
-                            (system.mass_matrix, system.forcing), cse=True)
-        eval_fnh = lambdify((system.q, system.u, p),
-                            system.nonholonomic_constraints.xreplace(
-                                system.eom_method.kindiffdict()), cse=True)
-        assert np.allclose(eval_fnh(q0, u0, p_vals).ravel(), np.zeros(4))
-        md, gd = eval_sys(q0, u0, p_vals)
-        ud0 = np.linalg.solve(md.astype(np.float64), gd.astype(np.float64)).ravel()
-        expected_state = dict(zip(self.bike.u.diff(t), (
+        p_vals = np.array(p_vals, dtype=np.float64)
+        q0 = np.array([initial_state[qi] for qi in system.q], dtype=np.float64)
+        u0 = np.array([initial_state[ui] for ui in system.u], dtype=np.float64)
+        # A single lambdified function shares the common subexpressions. Skipping the
+        # canonical ordering in the CSE speeds up the code generation.
+        fnh = system.nonholonomic_constraints.xreplace(system.eom_method.kindiffdict())
+        eval_sys = _lambdify((system.q, system.u, p),
+                             (system.mass_matrix, system.forcing, fnh),
+                             cse=partial(cse, order="none", list=False))
+        md, gd, fnh_vals = eval_sys(q0, u0, p_vals)
+        assert np.allclose(fnh_vals.ravel(), np.zeros(4))
+        assert md.dtype == gd.dtype == np.float64
+        ud0 = np.linalg.solve(md, gd).ravel()
+        expected_state = dict(zip(bike.u.diff(t), (
                 0.5903429412631302, -2.090870556233152, -0.8353281706376822,
                 7.855528112824374, -0.12055438978863461, -1.8472554144218631,
                 4.6198904039391895, -2.4548072904552343)))
@@ -131,10 +151,9 @@ class TestWhippleBicycleMoore:
     def test_descriptions(self) -> None:
         self.bike.define_connections()
         self.bike.define_objects()
-        for qi in self.bike.q:
-            assert self.bike.descriptions[qi]
-        for ui in self.bike.u:
-            assert self.bike.descriptions[ui]
+        described = {sym for sym, desc in self.bike.descriptions.items() if desc}
+        missing = {*self.bike.q, *self.bike.u} - described
+        assert not missing, f"missing descriptions: {missing}"
 
     @pytest.mark.usefixtures("_setup_default")
     def test_cranks(self) -> None:
@@ -169,41 +188,30 @@ class TestWhippleBicycleMoore:
         assert count_ops(tire.longitudinal_axis.to_matrix(self.bike.ground.frame)) > 30
         assert count_ops(tire.lateral_axis.to_matrix(self.bike.ground.frame)) > 30
 
-    @pytest.mark.parametrize("compute_rear", [True, False])
-    @pytest.mark.parametrize("compute_front", [True, False])
-    @pytest.mark.usefixtures("_setup_default")
+    @pytest.mark.parametrize(("compute_rear", "compute_front"), [
+        (True, True), (True, False), (False, True)])
     def test_computation_normal_force_nominal_config(
         self, compute_rear, compute_front
     ) -> None:
-        if not compute_rear and not compute_front:
-            return
-        self.bike.rear_tire.compute_normal_force = compute_rear
-        self.bike.front_tire.compute_normal_force = compute_front
-        self.bike.define_all()
-        system = self.bike.to_system()
-        system.apply_uniform_gravity(-Symbol("g") * self.bike.ground.get_normal(
-            self.bike.ground.origin))
-        system.q_ind = [*self.bike.q[:4], *self.bike.q[5:]]
-        system.q_dep = [self.bike.q[4]]
-        system.u_ind = [self.bike.u[3], *self.bike.u[5:7]]
-        system.u_dep = [*self.bike.u[:3], self.bike.u[4], self.bike.u[7]]
+        bike, system = _form_eoms(compute_rear, compute_front)
         assert len(system.u_aux) == int(compute_rear) + int(compute_front)
-        with ignore_point_warnings():
-            system.form_eoms(constraint_solver="CRAMER")
-        constants, _ = self._get_basu_mandal_values(self.bike)
+        constants, _ = _get_basu_mandal_values(bike)
         aux_eqs = system.eom_method.auxiliary_eqs
         fn_syms = []
         if compute_rear:
-            fn_syms.extend([self.bike.rear_tire.symbols["Fz"]])
+            fn_syms.extend([bike.rear_tire.symbols["Fz"]])
         if compute_front:
-            fn_syms.extend([self.bike.front_tire.symbols["Fz"]])
-        fn_eqs = Matrix.cramer_solve(*linear_eq_to_matrix(aux_eqs, fn_syms))
+            fn_syms.extend([bike.front_tire.symbols["Fz"]])
         zero = 1e-10
         zero_config = {ui.diff(): zero for ui in system.u}
         zero_config.update({ui: zero for ui in system.u})
         zero_config.update({qi: zero for qi in system.q})
-        zero_config[self.bike.q[4]] = np.pi / 10
-        fn_vals = [float(val) for val in msubs(fn_eqs, zero_config, constants)]
+        zero_config[bike.q[4]] = np.pi / 10
+        # Substitute the configuration before solving, such that the linear solve is
+        # numeric instead of symbolic.
+        aux_eqs = aux_eqs.xreplace({**zero_config, **constants})
+        fn_eqs = Matrix.cramer_solve(*linear_eq_to_matrix(aux_eqs, fn_syms))
+        fn_vals = [float(val) for val in fn_eqs]
         if compute_rear:
             np.testing.assert_allclose([fn_vals[0]], [612.836470588236])
         if compute_front:
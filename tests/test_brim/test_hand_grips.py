@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+from collections import defaultdict
+
 import pytest
-from sympy import Symbol
+from sympy import Symbol, zeros
 from sympy.physics.mechanics import Vector, dynamicsymbols
 
 from symbrim.bicycle.front_frames import RigidFrontFrameMoore
@@ -99,12 +101,10 @@ class TestHolonomicHandGrip:
         self.model.define_loads()
         self.model.define_constraints()
         assert len(self.conn.system.holonomic_constraints) == 6
-        expected_constraints = list(q)
-        for constr in self.conn.system.holonomic_constraints:
-            for exp_constr in expected_constraints:
-                if constr.xreplace({exp_constr: 0}) == 0:
-                    expected_constraints.remove(exp_constr)
-        assert not expected_constraints
+        # The constraints must vanish at zero and independently fix all coordinates.
+        constraints = self.conn.system.holonomic_constraints
+        assert constraints.xreplace(dict.fromkeys(q, 0)) == zeros(6, 1)
+        assert constraints.jacobian(q).rank() == 6
 
     def test_not_fully_constraint(self) -> None:
         q, d = dynamicsymbols("q"), Symbol("d")
@@ -159,28 +159,20 @@ class TestSpringDamperHandGrip:
         self.model.define_kinematics()
         self.model.define_loads()
         self.model.define_constraints()
-        loads_indi = [ld for act in self.conn.system.actuators for ld in act.to_loads()]
-        locations, loads = {}, []
-        for ld in loads_indi:
-            if ld.location not in locations:
-                locations[ld.location] = len(loads)
-                loads.append(ld)
-            else:
-                loads[locations[ld.location]] = ld.__class__(
-                    ld.location, ld.vector + loads[locations[ld.location]].vector)
-        assert len(loads) == 4
+        forces = defaultdict(lambda: Vector(0))
+        for act in self.conn.system.actuators:
+            for ld in act.to_loads():
+                forces[ld.location] += ld.vector
+        assert len(forces) == 4
         k, c = self.conn.symbols["k"], self.conn.symbols["c"]
-        for ld in loads:
-            if ld.location == self.front_frame.left_hand_grip.point:
-                assert (ld.vector - (k * q1 + c * q1.diff()) * self.steer_frame.x
-                        ).simplify() == Vector(0)
-            elif ld.location == self.left_arm.hand_interpoint:
-                assert (ld.vector + (k * q1 + c * q1.diff()) * self.steer_frame.x
-                        ).simplify() == Vector(0)
-            elif ld.location == self.front_frame.right_hand_grip.point:
-                assert (ld.vector - (-k * q2 - c * q2.diff()) * self.steer_frame.y
-                        ).simplify() == Vector(0)
+        # Vector equality compares the expanded components, so no simplify is needed.
+        for location, force in forces.items():
+            if location == self.front_frame.left_hand_grip.point:
+                assert force == (k * q1 + c * q1.diff()) * self.steer_frame.x
+            elif location == self.left_arm.hand_interpoint:
+                assert force == -(k * q1 + c * q1.diff()) * self.steer_frame.x
+            elif location == self.front_frame.right_hand_grip.point:
+                assert force == (-k * q2 - c * q2.diff()) * self.steer_frame.y
             else:
-                assert ld.location == self.right_arm.hand_interpoint
-                assert (ld.vector + (-k * q2 - c * q2.diff()) * self.steer_frame.y
-                        ).simplify() == Vector(0)
+                assert location == self.right_arm.hand_interpoint
+                assert force == -(-k * q2 - c * q2.diff()) * self.steer_frame.y
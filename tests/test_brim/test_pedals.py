@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from typing import TYPE_CHECKING
+
 import pytest
-from sympy import Symbol
+from sympy import Symbol, zeros
 from sympy.physics.mechanics import Vector, dynamicsymbols
 
 from symbrim.bicycle.cranks import MasslessCranks
@@ -10,6 +13,28 @@ from symbrim.brim.pedals import HolonomicPedals, SpringDamperPedals
 from symbrim.rider.legs import TwoPinStickLeftLeg, TwoPinStickRightLeg
 from symbrim.utilities.testing import _test_descriptions, create_model_of_connection
 
+if TYPE_CHECKING:
+    from symbrim.core import ModelBase
+
+
+def _create_aligned_feet_model(pedal_cls: type[PedalsBase]) -> ModelBase:
+    """Create a pedals model with the feet aligned to the cranks.
+
+    The positions of the feet are left to be defined by the test.
+    """
+    model = create_model_of_connection(pedal_cls)("model")
+    model.cranks = MasslessCranks("cranks")
+    model.left_leg = TwoPinStickLeftLeg("left_leg")
+    model.right_leg = TwoPinStickRightLeg("right_leg")
+    model.conn = pedal_cls("pedal_connection")
+    model.define_connections()
+    model.define_objects()
+    model.left_leg.foot_interframe.orient_axis(
+        model.cranks.frame, model.cranks.rotation_axis, 0)
+    model.right_leg.foot_interframe.orient_axis(
+        model.cranks.frame, model.cranks.rotation_axis, 0)
+    return model
+
 
 @pytest.mark.parametrize("pedal_cls", [HolonomicPedals, SpringDamperPedals])
 class TestPedalsBase:
@@ -70,17 +95,7 @@ class TestPedalsBase:
 class TestHolonomicPedals:
     @pytest.fixture(autouse=True)
     def _setup(self) -> None:
-        self.model = create_model_of_connection(HolonomicPedals)("model")
-        self.model.cranks = MasslessCranks("cranks")
-        self.model.left_leg = TwoPinStickLeftLeg("left_leg")
-        self.model.right_leg = TwoPinStickRightLeg("right_leg")
-        self.model.conn = HolonomicPedals("pedal_connection")
-        self.model.define_connections()
-        self.model.define_objects()
-        self.model.left_leg.foot_interframe.orient_axis(
-            self.model.cranks.frame, self.model.cranks.rotation_axis, 0)
-        self.model.right_leg.foot_interframe.orient_axis(
-            self.model.cranks.frame, self.model.cranks.rotation_axis, 0)
+        self.model = _create_aligned_feet_model(HolonomicPedals)
         self.cranks, self.left_leg, self.right_leg, self.conn = (
             self.model.cranks, self.model.left_leg, self.model.right_leg,
             self.model.conn)
@@ -97,12 +112,10 @@ class TestHolonomicPedals:
         self.model.define_loads()
         self.model.define_constraints()
         assert len(self.conn.system.holonomic_constraints) == 6
-        expected_constraints = list(q)
-        for constr in self.conn.system.holonomic_constraints:
-            for exp_constr in expected_constraints:
-                if constr.xreplace({exp_constr: 0}) == 0:
-                    expected_constraints.remove(exp_constr)
-        assert not expected_constraints
+        # The constraints must vanish at zero and independently fix all coordinates.
+        constraints = self.conn.system.holonomic_constraints
+        assert constraints.xreplace(dict.fromkeys(q, 0)) == zeros(6, 1)
+        assert constraints.jacobian(q).rank() == 6
 
     def test_not_fully_constraint(self) -> None:
         q, d = dynamicsymbols("q"), Symbol("d")
@@ -132,17 +145,7 @@ class TestHolonomicPedals:
 class TestSpringDamperPedals:
     @pytest.fixture(autouse=True)
     def _setup(self) -> None:
-        self.model = create_model_of_connection(SpringDamperPedals)("model")
-        self.model.cranks = MasslessCranks("cranks")
-        self.model.left_leg = TwoPinStickLeftLeg("left_leg")
-        self.model.right_leg = TwoPinStickRightLeg("right_leg")
-        self.model.conn = SpringDamperPedals("pedal_connection")
-        self.model.define_connections()
-        self.model.define_objects()
-        self.model.left_leg.foot_interframe.orient_axis(
-            self.model.cranks.frame, self.model.cranks.rotation_axis, 0)
-        self.model.right_leg.foot_interframe.orient_axis(
-            self.model.cranks.frame, self.model.cranks.rotation_axis, 0)
+        self.model = _create_aligned_feet_model(SpringDamperPedals)
         self.cranks, self.left_leg, self.right_leg, self.conn = (
             self.model.cranks, self.model.left_leg, self.model.right_leg,
             self.model.conn)
@@ -156,28 +159,20 @@ class TestSpringDamperPedals:
         self.model.define_kinematics()
         self.model.define_loads()
         self.model.define_constraints()
-        loads_indi = [ld for act in self.conn.system.actuators for ld in act.to_loads()]
-        locations, loads = {}, []
-        for ld in loads_indi:
-            if ld.location not in locations:
-                locations[ld.location] = len(loads)
-                loads.append(ld)
-            else:
-                loads[locations[ld.location]] = ld.__class__(
-                    ld.location, ld.vector + loads[locations[ld.location]].vector)
-        assert len(loads) == 4
+        forces = defaultdict(lambda: Vector(0))
+        for act in self.conn.system.actuators:
+            for ld in act.to_loads():
+                forces[ld.location] += ld.vector
+        assert len(forces) == 4
         k, c = self.conn.symbols["k"], self.conn.symbols["c"]
-        for ld in loads:
-            if ld.location == self.cranks.left_pedal_point:
-                assert (ld.vector - (k * q1 + c * q1.diff()) * self.cranks.frame.x
-                        ).simplify() == Vector(0)
-            elif ld.location == self.left_leg.foot_interpoint:
-                assert (ld.vector + (k * q1 + c * q1.diff()) * self.cranks.frame.x
-                        ).simplify() == Vector(0)
-            elif ld.location == self.cranks.right_pedal_point:
-                assert (ld.vector - (-k * q2 - c * q2.diff()) * self.cranks.frame.y
-                        ).simplify() == Vector(0)
+        # Vector equality compares the expanded components, so no simplify is needed.
+        for location, force in forces.items():
+            if location == self.cranks.left_pedal_point:
+                assert force == (k * q1 + c * q1.diff()) * self.cranks.frame.x
+            elif location == self.left_leg.foot_interpoint:
+                assert force == -(k * q1 + c * q1.diff()) * self.cranks.frame.x
+            elif location == self.cranks.right_pedal_point:
+                assert force == (-k * q2 - c * q2.diff()) * self.cranks.frame.y
             else:
-                assert ld.location == self.right_leg.foot_interpoint
-                assert (ld.vector + (-k * q2 - c * q2.diff()) * self.cranks.frame.y
-                        ).simplify() == Vector(0)
+                assert location == self.right_leg.foot_interpoint
+                assert force == -(-k * q2 - c * q2.diff()) * self.cranks.frame.y
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import pytest
-from sympy import Matrix, cos, eye, simplify, sin, zeros
+from sympy import Matrix, cos, eye, sin
 from sympy.physics.mechanics import ReferenceFrame
 
 from symbrim.bicycle.rear_frames import RigidRearFrameMoore
@@ -92,7 +92,8 @@ class TestFixedSeatConnection:
             self.rear_frame.saddle.frame, (self.conn.symbols["yaw"],
                                            self.conn.symbols["pitch"],
                                            self.conn.symbols["roll"]), "zyx")
-        assert simplify(self.pelvis.frame.dcm(int_frame)) == eye(3)
+        for component in self.pelvis.frame.dcm(int_frame) - eye(3):
+            assert check_zero(component)
         assert self.pelvis.body.masscenter.pos_from(
             self.rear_frame.saddle.point) == (
                 -self.pelvis.symbols["com_height"] * self.pelvis.z)
@@ -139,8 +140,9 @@ class TestSideLeanConnection:
         a = self.conn.symbols["alpha"]
         int_frame = ReferenceFrame("int_frame")
         int_frame.orient_axis(saddle.frame, a, saddle.frame.y)
-        assert simplify(self.conn.frame_lean_axis.to_matrix(saddle.frame) -
-                        int_frame.x.to_matrix(saddle.frame)) == zeros(3, 1)
+        for component in (self.conn.frame_lean_axis.to_matrix(saddle.frame) -
+                          int_frame.x.to_matrix(saddle.frame)):
+            assert check_zero(component)
         assert self.conn.pelvis_lean_axis == self.pelvis.x
         assert self.pelvis.body.masscenter.pos_from(
             saddle.point) == (-self.pelvis.symbols["com_height"] * self.pelvis.z)
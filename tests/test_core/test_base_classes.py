@@ -36,6 +36,25 @@ class MyLoad(LoadGroupBase):
             self.parent.frame, self.symbols["T"] * self.parent.rotation_axis))
 
 
+class MyTire(NonHolonomicTire):
+    """Tire with a custom symbol."""
+
+    @property
+    def descriptions(self) -> dict[object, str]:
+        """Dictionary of descriptions of the tire's attributes."""
+        return {
+            **super().descriptions,
+            self.symbols["my_sym1"]: "My symbol.",
+            self.symbols["my_sym2"]: "My symbol.",
+        }
+
+    def _define_objects(self) -> None:
+        """Define the objects in the tire."""
+        super()._define_objects()
+        self.symbols["my_sym1"] = Symbol(self._add_prefix("my_sym1"))
+        self.symbols["my_sym2"] = Symbol(self._add_prefix("my_sym2"))
+
+
 class TestModelBase:
     """Test the ModelBase class.
 
@@ -47,24 +66,6 @@ class TestModelBase:
 
     @pytest.fixture
     def _create_model(self) -> None:
-        class MyTire(NonHolonomicTire):
-            """Tire with a custom symbol."""
-
-            @property
-            def descriptions(self) -> dict[object, str]:
-                """Dictionary of descriptions of the tire's attributes."""
-                return {
-                    **super().descriptions,
-                    self.symbols["my_sym1"]: "My symbol.",
-                    self.symbols["my_sym2"]: "My symbol.",
-                }
-
-            def _define_objects(self) -> None:
-                """Define the objects in the tire."""
-                super()._define_objects()
-                self.symbols["my_sym1"] = Symbol(self._add_prefix("my_sym1"))
-                self.symbols["my_sym2"] = Symbol(self._add_prefix("my_sym2"))
-
         self.disc = RollingDisc("rolling_disc")
         self.disc.wheel = KnifeEdgeWheel("disc")
         self.disc.ground = FlatGround("ground")
@@ -32,6 +32,7 @@ class TestNewtonianBodyMixin:
         assert model.body.masscenter.vel(model.frame) == 0
 
     @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self) -> None:
         model = MyModel("name")
         model.define_all()
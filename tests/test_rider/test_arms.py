@@ -41,6 +41,7 @@ class TestArmBase:
         _test_descriptions(arm_cls("arm"))
 
     @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self, arm_cls, base_cls):
         arm = arm_cls("arm")
         arm.define_all()
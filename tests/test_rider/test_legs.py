@@ -40,6 +40,7 @@ class TestLegBase:
         _test_descriptions(leg_cls("leg"))
 
     @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self, leg_cls, base):
         leg = leg_cls("leg")
         leg.define_all()
@@ -25,6 +25,7 @@ class TestPelvisBase:
         _test_descriptions(pelvis_cls("pelvis"))
 
     @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self, pelvis_cls):
         pelvis = pelvis_cls("pelvis")
         pelvis.define_all()
@@ -36,6 +36,7 @@ class TestSacrumBase:
         _test_descriptions(self.conn)
 
     @pytest.mark.skipif(PlotConnection is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self):
         plot_conn = PlotConnection(self.conn.system.frame,
                                    self.conn.system.fixed_point, self.conn)
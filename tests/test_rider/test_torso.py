@@ -26,6 +26,7 @@ class TestTorsoBase:
         _test_descriptions(torso_cls("torso"))
 
     @pytest.mark.skipif(PlotModel is None, reason="symmeplot not installed")
+    @pytest.mark.plot
     def test_plotting(self, torso_cls):
         torso = torso_cls("torso")
         torso.define_all()
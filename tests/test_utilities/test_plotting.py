@@ -22,6 +22,8 @@ try:
 except ImportError:
     pytest.skip("symmeplot not installed", allow_module_level=True)
 
+pytestmark = pytest.mark.plot
+
 @pytest.fixture(scope="module", autouse=True)
 def mock_visualization():
     with patch("matplotlib.pyplot.subplots", return_value=(MagicMock(), MagicMock())):
@@ -85,3 +87,15 @@ class TestPlotting:
         assert isinstance(plotter.get_plot_object(self.rider.left_hip), PlotConnection)
         if plot_load_groups:
             assert isinstance(plotter.get_plot_object(self.load_group), PlotLoadGroup)
+
+    def test_add_multiple(self) -> None:
+        plotter = Plotter(self.rider.system.frame, self.rider.system.fixed_point)
+        models = plotter.add_models((self.rider.pelvis, self.rider.left_leg),
+                                    plot_load_groups=False)
+        conns = plotter.add_connections((self.rider.left_hip,), plot_submodels=False)
+        groups = plotter.add_load_groups((self.load_group,))
+        assert [obj.model for obj in models] == [self.rider.pelvis,
+                                                 self.rider.left_leg]
+        assert conns[0] is plotter.get_plot_object(self.rider.left_hip)
+        assert groups[0] is plotter.get_plot_object(self.load_group)
+        assert plotter.get_plot_object(self.rider) is None
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import os
+import subprocess
+import sys
+from functools import partial
+
 import pytest
-from sympy import S, acos, cos, sqrt, symbols
+from sympy import Max, S, acos, cos, cse, sqrt, symbols
 from sympy.abc import a, b, c
 from sympy.physics.mechanics import dynamicsymbols
 
-from symbrim.utilities.utilities import check_zero, random_eval
+from symbrim.utilities import utilities
+from symbrim.utilities.utilities import _lambdify, check_zero, random_eval
 
 
 class TestRandomEval:
@@ -59,9 +65,91 @@ class TestCheckZero:
     def test_is_not_zero(self, expr, args, kwargs) -> None:
         assert not check_zero(expr, *args, **kwargs)
 
+    def test_all_evaluations_used(self) -> None:
+        assert not check_zero(Max(a - 0.9, 0), n_evaluations=1000)
+
     def test_too_loose_tolerance(self) -> None:
         assert check_zero(acos(cos(a)) - a + 0.001, atol=1e-2)
 
     def test_non_expression(self) -> None:
         assert check_zero(0.0)
         assert not check_zero(3.3)
+
+    def test_structural_zero_not_evaluated(self, monkeypatch) -> None:
+        def _fail(*_args, **_kwargs):
+            raise AssertionError("lambdify should not be called")
+
+        monkeypatch.setattr(utilities, "_lambdify", _fail)
+        assert check_zero(S.Zero)
+        assert check_zero(cos(a) - cos(a))
+
+
+class TestLambdifyCache:
+    @pytest.fixture(autouse=True)
+    def _setup(self, monkeypatch, tmp_path) -> None:
+        self.cache_dir = tmp_path / "lambdify"
+        monkeypatch.setattr(utilities, "_LAMBDIFY_CACHE_DIR", self.cache_dir)
+
+    def test_disabled(self, monkeypatch) -> None:
+        monkeypatch.delenv("SYMBRIM_LAMBDIFY_CACHE", raising=False)
+        assert _lambdify((a, b), a + b)(1, 2) == 3
+        assert not self.cache_dir.exists()
+
+    def test_enabled(self, monkeypatch) -> None:
+        monkeypatch.setenv("SYMBRIM_LAMBDIFY_CACHE", "1")
+        expr = sqrt(a) + cos(b) ** 2 + cos(b)
+        f1 = _lambdify((a, b), expr, cse=True)
+        assert len(list(self.cache_dir.iterdir())) == 1
+        f2 = _lambdify((a, b), expr, cse=True)
+        assert f2 is not f1
+        assert f2(4.0, 0.0) == f1(4.0, 0.0) == 4.0
+        assert len(list(self.cache_dir.iterdir())) == 1
+        assert check_zero(expr - sqrt(a) - cos(b) ** 2 - cos(b))
+
+    def test_key_distinguishes_expressions(self, monkeypatch) -> None:
+        monkeypatch.setenv("SYMBRIM_LAMBDIFY_CACHE", "1")
+        _lambdify((a, b), a + b)
+        _lambdify((a, b), a + b)
+        _lambdify((a, b), a * b)
+        _lambdify((a, b), a + b, cse=True)
+        assert len(list(self.cache_dir.iterdir())) == 3
+
+    def test_key_of_callable_is_stable(self, monkeypatch) -> None:
+        monkeypatch.setenv("SYMBRIM_LAMBDIFY_CACHE", "1")
+        _lambdify((a, b), a + b, cse=partial(cse, order="none"))
+        _lambdify((a, b), a + b, cse=partial(cse, order="none"))
+        _lambdify((a, b), a + b, cse=partial(cse, order="canonical"))
+        assert len(list(self.cache_dir.iterdir())) == 2
+
+    def test_reload_with_lambdify_imports(self, monkeypatch) -> None:
+        monkeypatch.setenv("SYMBRIM_LAMBDIFY_CACHE", "1")
+        assert _lambdify((a, b), Max(a, b))(1.0, 2.0) == 2.0
+        assert len(list(self.cache_dir.iterdir())) == 1
+        assert _lambdify((a, b), Max(a, b))(3.0, 2.0) == 3.0
+
+    def test_custom_modules_not_cached(self, monkeypatch) -> None:
+        monkeypatch.setenv("SYMBRIM_LAMBDIFY_CACHE", "1")
+        assert type(_lambdify((a, b), cos(a) + b, modules="math")(0, 1)) is float
+        assert not self.cache_dir.exists()
+
+    def test_check_zero_key_with_derivatives(self, monkeypatch) -> None:
+        monkeypatch.setenv("SYMBRIM_LAMBDIFY_CACHE", "1")
+        q, u = dynamicsymbols("q"), dynamicsymbols("q", 1)
+        expr = (u + q) ** 2 - u ** 2 - 2 * u * q - q ** 2
+        assert check_zero(expr)
+        assert check_zero(expr)
+        assert len(list(self.cache_dir.iterdir())) == 1
+
+    def test_key_independent_of_hash_seed(self, tmp_path) -> None:
+        code = ("from sympy import cos, sin\n"
+                "from sympy.physics.mechanics import dynamicsymbols\n"
+                "from symbrim.utilities.utilities import check_zero\n"
+                "q1, q2, q3 = dynamicsymbols('q1:4')\n"
+                "u3 = q3.diff()\n"
+                "assert check_zero(sin(q1 + q2) - sin(q1) * cos(q2) - "
+                "cos(q1) * sin(q2) + (u3 + q1) ** 2 - u3 ** 2 - 2 * u3 * q1 - q1 ** 2)")
+        for seed in ("1", "2", "3"):
+            env = {**os.environ, "XDG_CACHE_HOME": str(tmp_path),
+                   "PYTHONHASHSEED": seed, "SYMBRIM_LAMBDIFY_CACHE": "1"}
+            subprocess.run([sys.executable, "-c", code], env=env, check=True)  # noqa: S603
+        assert len(list((tmp_path / "symbrim" / "lambdify").iterdir())) == 1